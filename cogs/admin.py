@@ -11,9 +11,9 @@ from discord import (
     Interaction,
     app_commands,
 )
-from discord.ext.commands import Bot, Cog
+from discord.ext.commands import Bot, Cog, ExtensionError
 
-from constants import ROLES_CHANNEL, RULES_CHANNEL
+from constants import COGS, GUILD_ID, ROLES_CHANNEL, RULES_CHANNEL
 from services import (
     get_subscriptions,
     get_users,
@@ -56,6 +56,33 @@ class Admin(Cog):
             "powershell.exe", "-File", "C:\\val-mal-bot\\restart_bot.ps1"
         )
 
+    @app_commands.command(description="Reloads a cog without restarting the bot")
+    @app_commands.commands.default_permissions(administrator=True)
+    @app_commands.describe(extension="The cog to reload")
+    @app_commands.choices(
+        extension=[
+            app_commands.Choice(name=ext.removeprefix("cogs."), value=ext)
+            for ext in COGS
+        ]
+    )
+    async def reload(
+        self, interaction: Interaction, extension: app_commands.Choice[str]
+    ) -> None:
+        try:
+            await self.bot.reload_extension(extension.value)
+        except ExtensionError as e:
+            logger.warning("Failed to reload %s: %s", extension.value, e)
+            await interaction.response.send_message(
+                f"Failed to reload {extension.name}: {e}"
+            )
+            return None
+        # Interactions resolve from the guild copy made in setup_hook, and
+        # unloading dropped the cog's entries from it, so copy the reloaded
+        # global commands back in. Their signatures are unchanged, so the
+        # synced commands on Discord's side stay valid.
+        self.bot.tree.copy_global_to(guild=discord.Object(id=GUILD_ID))
+        await interaction.response.send_message(f"Reloaded {extension.name}")
+
     @app_commands.command(description="Deletes all messages in the channel")
     @app_commands.commands.default_permissions(administrator=True)
     async def nuke(self, interaction: Interaction) -> None:
@@ -64,7 +91,7 @@ class Admin(Cog):
             (ForumChannel, CategoryChannel, DMChannel, GroupChannel),
         ):
             logger.warning(
-                f"Nuke aborted: invalid channel type {type(interaction.channel)}"
+                "Nuke aborted: invalid channel type %s", type(interaction.channel)
             )
             return None
         await interaction.response.send_message("Nuking channel...")
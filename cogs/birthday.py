@@ -5,7 +5,6 @@ from typing import Literal
 
 import discord
 import pendulum
-import polars as pl
 from discord import Interaction, Member, User, app_commands
 from discord.app_commands import Choice, Range
 from discord.ext.commands import Bot, GroupCog
@@ -21,7 +20,12 @@ from constants import (
     Months,
     UserRecord,
 )
-from services import get_next_leap, read_parquet_cached, send_message, update_birthday
+from services import (
+    get_next_leap,
+    read_row_from_parquet,
+    send_message,
+    update_birthday,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -79,14 +83,14 @@ class Birthday(GroupCog):
                 + "Have you tried using the autocomplete options provided? "
                 + "Because those are the only timezones I know of."
             )
-            logger.warning(f"Invalid timezone provided: {timezone}")
+            logger.warning("Invalid timezone provided: %s", timezone)
             return True
 
         if day > MAX_DAYS[month]:
             await interaction.response.send_message(
                 f"{month.name} doesn't have that many days..."
             )
-            logger.warning(f"Invalid day {day} for month {month.name}")
+            logger.warning("Invalid day %s for month %s", day, month.name)
             return True
 
         return False
@@ -207,13 +211,7 @@ class Birthday(GroupCog):
         interaction: Interaction,
     ) -> None:
         try:
-            df = await read_parquet_cached(USERS)
-            existing_user_row = df.filter(pl.col("id") == interaction.user.id)
-            if existing_user_row.height == 0:
-                existing_user = None
-            else:
-                existing_user = existing_user_row.row(0, named=True)
-
+            existing_user = await read_row_from_parquet(interaction.user.id, USERS)
             if existing_user is None:
                 await send_message(
                     f"User {interaction.user.name} ({interaction.user.id}) attempted to remove a birthday but had no record.",
@@ -6,7 +6,6 @@ from typing import Literal
 import discord
 import orjson
 import pendulum
-import polars as pl
 from discord import (
     CategoryChannel,
     Embed,
@@ -28,7 +27,7 @@ from discord import (
     VoiceChannel,
 )
 from discord.abc import PrivateChannel
-from discord.ext.commands import Bot, Cog, CommandError, Context
+from discord.ext.commands import Bot, Cog
 from pendulum import DateTime
 
 from constants import (
@@ -50,7 +49,7 @@ from services import (
     get_discriminator,
     get_ordinal_suffix,
     get_pfp,
-    read_parquet_cached,
+    read_row_from_parquet,
     send_embed,
     send_message,
     upsert_row_to_parquet,
@@ -58,6 +57,9 @@ from services import (
 
 logger = logging.getLogger(__name__)
 
+_MESSAGE_REPLIES: dict[str, str] = {"ping": "pong", "plap": "clank"}
+_MESSAGE_REPLY_MAX_LENGTH = max(map(len, _MESSAGE_REPLIES))
+
 
 class Events(Cog):
     def __init__(self, bot: Bot) -> None:
@@ -156,11 +158,13 @@ class Events(Cog):
                 MESSAGES,
             )
 
-            content = message.content.lower()
-            if content == "ping":
-                await message.channel.send("pong")
-            elif content == "plap":
-                await message.channel.send("clank")
+            # Skip case-folding ordinary chat that can't be a trigger word
+            content = message.content
+            if len(content) > _MESSAGE_REPLY_MAX_LENGTH:
+                return None
+            reply = _MESSAGE_REPLIES.get(content.lower())
+            if reply is not None:
+                await message.channel.send(reply)
         except Exception as e:
             await self._handle_error(e, "Fatal error with on_message event")
 
@@ -180,7 +184,7 @@ class Events(Cog):
                 WELCOME_CHANNEL,
             )
 
-            age = get_age(pendulum.instance(member.created_at))
+            age = get_age(member.created_at)
             embed = self._base_embed(
                 f"{member.mention} {member.name}{discriminator}", 0x43B582
             )
@@ -253,12 +257,6 @@ class Events(Cog):
         except Exception as e:
             await self._handle_error(e, "Fatal error with on_raw_member_remove event")
 
-    @Cog.listener()
-    async def on_command_error(self, ctx: Context, error: CommandError) -> None:
-        channel_mention = get_channel_mention(ctx.channel)
-        message = f"Command not found: {ctx.message.content}\nSent by: {ctx.author.mention} in {channel_mention}\n{error}"
-        await send_message(message, AUDIT_LOGS_CHANNEL)
-
     @Cog.listener()
     async def on_member_update(self, before: Member, after: Member) -> None:
         try:
@@ -548,10 +546,9 @@ class Events(Cog):
             await self._handle_error(e, "Fatal error with on_invite_delete event")
 
     async def _get_message_content(self, message_id: int) -> str:
-        df = await read_parquet_cached(MESSAGES)
-        message_row = df.filter(pl.col("id") == message_id)
-        if message_row.height != 0:
-            return message_row.row(0, named=True)["contents"]
+        message_row = await read_row_from_parquet(message_id, MESSAGES)
+        if message_row is not None:
+            return message_row["contents"]
         return DEFAULT_MISSING_CONTENT
 
     async def _log_role_change(
@@ -9,7 +9,6 @@ import pendulum
 import polars as pl
 from discord.ext import tasks
 from discord.ext.commands import Bot, Cog
-from dotenv import load_dotenv
 from polars import DataFrame
 
 from constants import (
@@ -26,8 +25,6 @@ from services import (
     update_birthday,
 )
 
-load_dotenv()
-
 logger = logging.getLogger(__name__)
 
 
@@ -35,12 +32,16 @@ class Tasks(Cog):
     def __init__(self, bot: Bot) -> None:
         self.bot = bot
 
-    @Cog.listener()
-    async def on_ready(self) -> None:
-        if not self.check_birthdays.is_running():
-            self.check_birthdays.start()
-        if not self.backup_data.is_running():
-            self.backup_data.start()
+    # Started and cancelled with the cog rather than from on_ready, so a
+    # /reload swaps the running loops for the new module's instead of leaving
+    # the old ones behind (on_ready doesn't fire again after a reload)
+    async def cog_load(self) -> None:
+        self.check_birthdays.start()
+        self.backup_data.start()
+
+    async def cog_unload(self) -> None:
+        self.check_birthdays.cancel()
+        self.backup_data.cancel()
 
     _quarter_hours = [
         pendulum.Time(hour, minute) for hour in range(24) for minute in (0, 15, 30, 45)
@@ -126,13 +127,19 @@ class Tasks(Cog):
             logger.error(f"{error_msg}\nTraceback:\n{error_details['traceback']}")
             await self.log_error(error_msg, error_details["traceback"])
 
+    @backup_data.before_loop
+    @check_birthdays.before_loop
+    async def _wait_until_ready(self) -> None:
+        # cog_load runs from setup_hook, before the user and channel caches fill
+        await self.bot.wait_until_ready()
+
     async def _process_birthday_records(self, birthdays_now: DataFrame) -> None:
         now = pendulum.now()
         for record in birthdays_now.iter_rows(named=True):
             user_id = record["id"]
             user = self.bot.get_user(int(user_id))
             if user is None:
-                logger.warning(f"Discord user ID {user_id} not found in guild cache")
+                logger.warning("Discord user ID %s not found in guild cache", user_id)
                 await send_message(
                     f"_process_birthday_records: User with ID {user_id} not found.",
                     BOT_ADMIN_CHANNEL,
@@ -33,6 +33,8 @@ PING_ROLE = 1292348084998897737
 BLUESKY_ROLE = 1345584502805626973
 FREE_STUFF_ROLE = 1359500454941298709
 
+LIVE_ALERTS_MENTION = f"<@&{LIVE_ALERTS_ROLE}>"
+
 NSFW_ACCESS_ROLE = 1292348175553794050
 
 HE_HIM_ROLE = 1292386380038672404
@@ -57,6 +59,8 @@ DEFAULT_MISSING_CONTENT = "`Message content not found in cache`"
 
 BROADCASTER_USERNAME = "valinmalach"
 
+STREAM_EMBED_COLOR = 0x9046FF
+
 APP_ACCESS_TOKEN_FILE = "data/twitch/app_access_token.txt"
 USER_REFRESH_TOKEN_FILE = "data/twitch/user_refresh_token.txt"
 USER_ACCESS_TOKEN_FILE = "data/twitch/user_access_token.txt"
@@ -64,6 +68,7 @@ BROADCASTER_REFRESH_TOKEN_FILE = "data/twitch/broadcaster_refresh_token.txt"
 BROADCASTER_ACCESS_TOKEN_FILE = "data/twitch/broadcaster_access_token.txt"
 
 TWITCH_DIR = "data/twitch"
+COMMAND_TREE_HASH_FILE = "data/command_tree_hash.txt"
 BLUESKY = "data/bluesky.parquet"
 LIVE_ALERTS = "data/live_alerts.parquet"
 MESSAGES = "data/messages.parquet"
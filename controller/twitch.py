@@ -3,23 +3,24 @@ import io
 import logging
 import os
 import traceback
-from typing import Any, Awaitable, Callable
+from collections import OrderedDict
+from datetime import UTC, datetime
+from typing import Any, Awaitable, Callable, Final, NoReturn
 
 import discord
+import orjson
 import pendulum
-import polars as pl
 from discord.ui import View
-from dotenv import load_dotenv
 from fastapi import APIRouter, HTTPException, Request, Response
 
 from constants import (
     BOT_ADMIN_CHANNEL,
     BROADCASTER_USERNAME,
-    HMAC_PREFIX,
     LIVE_ALERTS,
-    LIVE_ALERTS_ROLE,
+    LIVE_ALERTS_MENTION,
     PROMO_CHANNEL,
     STREAM_ALERTS_CHANNEL,
+    STREAM_EMBED_COLOR,
     TWITCH_MESSAGE_ID,
     TWITCH_MESSAGE_SIGNATURE,
     TWITCH_MESSAGE_TIMESTAMP,
@@ -54,11 +55,12 @@ from services import (
     get_stream_vod,
     get_user,
     hug,
+    is_signature_well_formed,
     kofi,
     lurk,
-    parse_rfc3339,
     raid,
-    read_parquet_cached,
+    read_row_from_parquet,
+    run_in_background,
     send_embed,
     send_message,
     shoutout,
@@ -74,8 +76,6 @@ from services.helper.http_client import http_client_manager
 from services.twitch.shoutout_queue import shoutout_queue
 from services.twitch.token_manager import token_manager
 
-load_dotenv()
-
 APP_URL = os.getenv("APP_URL")
 TWITCH_BROADCASTER_ID = os.getenv("TWITCH_BROADCASTER_ID")
 TWITCH_CLIENT_ID = os.getenv("TWITCH_CLIENT_ID")
@@ -86,38 +86,81 @@ logger = logging.getLogger(__name__)
 
 twitch_router = APIRouter()
 
+# Static parts of the stream online/offline embeds. Embed.from_dict keeps
+# references to nested values, so only top-level scalars live here and every
+# nested dict/list is built fresh per event.
+_STREAM_EMBED_TEMPLATE: dict[str, Any] = {"type": "rich", "color": STREAM_EMBED_COLOR}
+
+# Twitch delivers at least once and retries on slow or failed responses.
+# Remember recently handled message ids and refuse anything sent further from
+# now than the window Twitch recommends, so retries and replays don't post twice.
+_SEEN_MESSAGE_IDS_MAXSIZE: Final = 4096
+_MESSAGE_MAX_AGE_SECONDS: Final = 600
+_seen_message_ids: OrderedDict[str, None] = OrderedDict()
+
+
+def _get_message_age(timestamp: str) -> float | None:
+    """Seconds since Twitch sent the message, or None if the timestamp is malformed."""
+    try:
+        sent_at = datetime.fromisoformat(timestamp)
+    except ValueError:
+        return None
+    # Without an offset the instant is ambiguous, and comparing it to an aware
+    # datetime would raise TypeError
+    if sent_at.utcoffset() is None:
+        return None
+    return (datetime.now(UTC) - sent_at).total_seconds()
+
+
+def _remember_message(message_id: str) -> None:
+    _seen_message_ids[message_id] = None
+    if len(_seen_message_ids) > _SEEN_MESSAGE_IDS_MAXSIZE:
+        _seen_message_ids.popitem(last=False)
+
+
+def verify_signature(
+    endpoint: str,
+    raw_body: bytes,
+    twitch_message_id: str,
+    twitch_message_timestamp: str,
+    twitch_message_signature: str,
+) -> None:
+    if not is_signature_well_formed(twitch_message_signature):
+        _reject_signature(endpoint)
+
+    message = get_hmac_message(twitch_message_id, twitch_message_timestamp, raw_body)
+    secret_hmac = get_hmac(TWITCH_WEBHOOK_SECRET, message)
+
+    if not verify_message(secret_hmac, twitch_message_signature):
+        _reject_signature(endpoint)
 
-async def validate_call(request: Request, endpoint: str) -> Response | None:
-    headers = request.headers
-    body: dict[str, Any] = await request.json()
 
-    if headers.get(TWITCH_MESSAGE_TYPE) == "webhook_callback_verification":
+def validate_call(message_type: str, body: dict[str, Any]) -> Response | None:
+    if message_type == "webhook_callback_verification":
         challenge = body.get("challenge", "")
         return Response(challenge or "", status_code=200)
 
-    if headers.get(TWITCH_MESSAGE_TYPE, "").lower() == "revocation":
+    if message_type.lower() == "revocation":
         subscription: dict[str, Any] = body.get("subscription", {})
         condition = subscription.get("condition", {})
-        await send_message(
-            f"Revoked {subscription.get('type', 'unknown')} notifications for condition: {condition} because {subscription.get('status', 'No reason provided')}",
-            BOT_ADMIN_CHANNEL,
+        run_in_background(
+            send_message(
+                f"Revoked {subscription.get('type', 'unknown')} notifications for condition: {condition} because {subscription.get('status', 'No reason provided')}",
+                BOT_ADMIN_CHANNEL,
+            )
         )
         return Response(status_code=204)
 
-    twitch_message_id = headers.get(TWITCH_MESSAGE_ID, "")
-    twitch_message_timestamp = headers.get(TWITCH_MESSAGE_TIMESTAMP, "")
-    body_str = (await request.body()).decode()
-    message = get_hmac_message(twitch_message_id, twitch_message_timestamp, body_str)
-    secret_hmac = HMAC_PREFIX + get_hmac(TWITCH_WEBHOOK_SECRET, message)
 
-    twitch_message_signature = headers.get(TWITCH_MESSAGE_SIGNATURE, "")
-    if not verify_message(secret_hmac, twitch_message_signature):
-        logger.warning("403: Forbidden. Signature does not match.")
-        await send_message(
+def _reject_signature(endpoint: str) -> NoReturn:
+    logger.warning("403: Forbidden. Signature does not match.")
+    run_in_background(
+        send_message(
             f"403: Forbidden request on {endpoint}. Signature does not match.",
             BOT_ADMIN_CHANNEL,
         )
-        raise HTTPException(status_code=403)
+    )
+    raise HTTPException(status_code=403)
 
 
 async def log_error(message: str, traceback_str: str) -> None:
@@ -143,26 +186,70 @@ async def handle_error(e: Exception, context: str) -> None:
 
 
 async def process_webhook(
-    request: Request, endpoint: str, event_model, expected_type: str, task_func
+    request: Request,
+    endpoint: str,
+    event_model,
+    expected_type: str,
+    task_func,
+    should_process: Callable[[dict[str, Any]], bool] | None = None,
 ) -> Response:
     try:
-        validation = await validate_call(request, endpoint)
+        raw_body = await request.body()
+        # Each Headers lookup scans the raw header list, so read them once
+        headers = request.headers
+        message_id = headers.get(TWITCH_MESSAGE_ID, "")
+        message_timestamp = headers.get(TWITCH_MESSAGE_TIMESTAMP, "")
+        # Authenticate the raw bytes before spending anything on parsing them
+        verify_signature(
+            endpoint,
+            raw_body,
+            message_id,
+            message_timestamp,
+            headers.get(TWITCH_MESSAGE_SIGNATURE, ""),
+        )
+        if message_id in _seen_message_ids:
+            logger.info("Ignoring replayed EventSub message %s", message_id)
+            return Response(status_code=204)
+        message_age = _get_message_age(message_timestamp)
+        if message_age is None:
+            logger.warning(
+                "Ignoring EventSub message %s with malformed timestamp %r",
+                message_id,
+                message_timestamp,
+            )
+            return Response(status_code=204)
+        # Negative ages are timestamps in the future, which are just as suspect
+        if abs(message_age) > _MESSAGE_MAX_AGE_SECONDS:
+            logger.warning(
+                "Ignoring EventSub message %s outside the replay window, sent %.0f seconds ago",
+                message_id,
+                message_age,
+            )
+            return Response(status_code=204)
+        body: dict[str, Any] = orjson.loads(raw_body)
+        validation = validate_call(headers.get(TWITCH_MESSAGE_TYPE, ""), body)
         if validation:
             return validation
 
-        body: dict[str, Any] = await request.json()
+        if should_process is not None and not should_process(body):
+            return Response(status_code=202)
+
         event_sub = event_model.model_validate(body)
         if event_sub.subscription.type != expected_type:
             logger.warning(
-                f"400: Bad request. Invalid subscription type: {event_sub.subscription.type}"
+                "400: Bad request. Invalid subscription type: %s",
+                event_sub.subscription.type,
             )
-            await send_message(
-                f"400: Bad request on {endpoint}. Invalid subscription type.",
-                BOT_ADMIN_CHANNEL,
+            run_in_background(
+                send_message(
+                    f"400: Bad request on {endpoint}. Invalid subscription type.",
+                    BOT_ADMIN_CHANNEL,
+                )
             )
             raise HTTPException(status_code=400)
 
-        _ = asyncio.create_task(task_func(event_sub))
+        run_in_background(task_func(event_sub), name=task_func.__name__)
+        _remember_message(message_id)
         return Response(status_code=202)
     except HTTPException as e:
         raise e
@@ -176,9 +263,17 @@ def _get_twitch_url(user_login: str) -> str:
     return f"https://www.twitch.tv/{user_login}"
 
 
+def _get_embed_author(name: str, user_info: User | None, url: str) -> dict[str, str]:
+    """Build the raw embed author payload, omitting the icon when unknown."""
+    author = {"name": name, "url": url}
+    if user_info:
+        author["icon_url"] = user_info.profile_image_url
+    return author
+
+
 def _get_live_alerts_mention(channel_id: int) -> str | None:
     """Get the live alerts role mention if channel is the stream alerts channel."""
-    return f"<@&{LIVE_ALERTS_ROLE}>" if channel_id == STREAM_ALERTS_CHANNEL else None
+    return LIVE_ALERTS_MENTION if channel_id == STREAM_ALERTS_CHANNEL else None
 
 
 def _is_main_broadcaster(broadcaster_id: str | int) -> bool:
@@ -186,11 +281,11 @@ def _is_main_broadcaster(broadcaster_id: str | int) -> bool:
     return str(broadcaster_id) == TWITCH_BROADCASTER_ID
 
 
-def _extract_alert_data(alert: dict[str, Any]) -> tuple[int, int, str, str]:
+def _extract_alert_data(alert: dict[str, Any]) -> tuple[int, int, int, str]:
     """Extract relevant data from alert dictionary."""
     channel_id = alert.get("channel_id", 0)
     message_id = alert.get("message_id", 0)
-    stream_id = alert.get("stream_id", "")
+    stream_id = alert.get("stream_id", 0)
     stream_started_at = alert.get("stream_started_at", "")
     return channel_id, message_id, stream_id, stream_started_at
 
@@ -211,7 +306,7 @@ async def _handle_broadcaster_stream_start(
     if not is_main_broadcaster:
         return None
 
-    _ = asyncio.create_task(shoutout_queue.activate())
+    run_in_background(shoutout_queue.activate(), name="shoutout-queue")
     await twitch_send_message(
         str(broadcaster_id),
         "NilavHcalam is here valinmArrive",
@@ -228,28 +323,28 @@ def _create_stream_online_embed(stream_info, user_info: User | None) -> discord.
     raw_thumb_url = stream_info.thumbnail_url.replace("{width}x{height}", "400x225")
     cache_busted_thumb_url = f"{raw_thumb_url}?cb={int(pendulum.now().timestamp())}"
 
-    return (
-        discord.Embed(
-            description=f"[**{stream_info.title}**]({url})",
-            color=0x9046FF,
-            timestamp=parse_rfc3339(stream_info.started_at),
-        )
-        .set_author(
-            name=f"{stream_info.user_name} is now live!",
-            icon_url=user_info.profile_image_url if user_info else None,
-            url=url,
-        )
-        .add_field(
-            name="**Game**",
-            value=f"{stream_info.game_name}",
-            inline=True,
-        )
-        .add_field(
-            name="**Viewers**",
-            value=f"{stream_info.viewer_count}",
-            inline=True,
-        )
-        .set_image(url=cache_busted_thumb_url)
+    return discord.Embed.from_dict(
+        _STREAM_EMBED_TEMPLATE
+        | {
+            "description": f"[**{stream_info.title}**]({url})",
+            "timestamp": stream_info.started_at,
+            "author": _get_embed_author(
+                f"{stream_info.user_name} is now live!", user_info, url
+            ),
+            "fields": [
+                {
+                    "name": "**Game**",
+                    "value": f"{stream_info.game_name}",
+                    "inline": True,
+                },
+                {
+                    "name": "**Viewers**",
+                    "value": f"{stream_info.viewer_count}",
+                    "inline": True,
+                },
+            ],
+            "image": {"url": cache_busted_thumb_url},
+        }
     )
 
 
@@ -277,14 +372,15 @@ async def _save_live_alert(
 
     try:
         upsert_row_to_parquet(alert, LIVE_ALERTS)
-        _ = asyncio.create_task(
+        run_in_background(
             update_alert(
                 broadcaster_id,
                 channel,
                 message_id,
                 int(stream_info.id),
                 stream_info.started_at,
-            )
+            ),
+            name=f"live-alert-{broadcaster_id}",
         )
     except Exception as e:
         await handle_error(
@@ -317,7 +413,7 @@ async def _stream_online_task(event_sub: StreamOnlineEventSub) -> None:
                 f"Failed to send live alert message\nbroadcaster_id: {broadcaster_id}\nchannel_id: {channel}",
                 BOT_ADMIN_CHANNEL,
             )
-            logger.error(f"Failed to send embed for broadcaster {broadcaster_id}")
+            logger.error("Failed to send embed for broadcaster %s", broadcaster_id)
             return None
 
         await _save_live_alert(broadcaster_id, channel, message_id, stream_info)
@@ -340,25 +436,24 @@ async def _fetch_stream_data(
     user_info = await get_user(broadcaster_id)
     channel_info = await get_channel(broadcaster_id)
 
-    df = await read_parquet_cached(LIVE_ALERTS)
-    alert_row = df.filter(pl.col("id") == broadcaster_id)
-    if alert_row.height == 0:
+    alert = await read_row_from_parquet(broadcaster_id, LIVE_ALERTS)
+    if alert is None:
         logger.warning(
-            f"Failed to fetch live alert for broadcaster_id={broadcaster_id}: No record found; Skipping"
+            "Failed to fetch live alert for broadcaster_id=%s: No record found; Skipping",
+            broadcaster_id,
         )
         return None, None, None
 
-    alert = alert_row.row(0, named=True)
     return user_info, channel_info, alert
 
 
-async def _get_vod_info(broadcaster_id: int, stream_id: str) -> Video | None:
+async def _get_vod_info(broadcaster_id: int, stream_id: int) -> Video | None:
     """Safely fetch VOD information with error handling."""
     if not stream_id:
         return None
 
     try:
-        return await get_stream_vod(broadcaster_id, int(stream_id))
+        return await get_stream_vod(broadcaster_id, stream_id)
     except Exception as e:
         await handle_error(
             e, f"Failed to fetch VOD info for broadcaster {broadcaster_id}"
@@ -375,34 +470,38 @@ def _create_offline_embed(
 ) -> discord.Embed:
     """Create the offline embed with all necessary information."""
     url = _get_twitch_url(event_sub.event.broadcaster_user_login)
-    embed = (
-        discord.Embed(
-            description=f"**{channel_info.title if channel_info else ''}**",
-            color=0x9046FF,
-            timestamp=pendulum.now(),
-        )
-        .set_author(
-            name=f"{event_sub.event.broadcaster_user_name} was live",
-            icon_url=user_info.profile_image_url if user_info else None,
-            url=url,
-        )
-        .add_field(
-            name="**Game**",
-            value=f"{channel_info.game_name if channel_info else ''}",
-            inline=True,
-        )
-    )
-
+    fields = [
+        {
+            "name": "**Game**",
+            "value": f"{channel_info.game_name if channel_info else ''}",
+            "inline": True,
+        }
+    ]
     if vod_info:
-        vod_url = vod_info.url
-        embed = embed.add_field(
-            name="**VOD**",
-            value=f"[**Click to view**]({vod_url})",
-            inline=True,
-        )
+        fields.append(
+            {
+                "name": "**VOD**",
+                "value": f"[**Click to view**]({vod_info.url})",
+                "inline": True,
+            }
+        )
+
+    embed = discord.Embed.from_dict(
+        _STREAM_EMBED_TEMPLATE
+        | {
+            "description": f"**{channel_info.title if channel_info else ''}**",
+            "author": _get_embed_author(
+                f"{event_sub.event.broadcaster_user_name} was live", user_info, url
+            ),
+            "fields": fields,
+        }
+    )
+    # Set the datetime directly; a timestamp in the payload would be
+    # formatted to a string only for from_dict to parse it back
+    embed.timestamp = pendulum.now()
 
     if stream_started_at:
-        started_at = parse_rfc3339(stream_started_at)
+        started_at = datetime.fromisoformat(stream_started_at)
         age = get_age(started_at, limit_units=2)
         embed = embed.set_footer(text=f"Online for {age} | Offline at")
 
@@ -417,7 +516,8 @@ async def _update_offline_message(
         await edit_embed(message_id, embed, channel_id, content=content)
     except discord.NotFound:
         logger.warning(
-            f"Message not found when editing offline embed for message_id={message_id}; continuing"
+            "Message not found when editing offline embed for message_id=%s; continuing",
+            message_id,
         )
     except Exception as e:
         await handle_error(e, "Error editing offline embed")
@@ -461,43 +561,47 @@ async def _stream_offline_task(event_sub: StreamOfflineEventSub) -> None:
         await handle_error(e, f"Error in _stream_offline_task for {broadcaster_id}")
 
 
+async def _default_command(event_sub: ChannelChatMessageEventSub, args: str) -> None:
+    """Default no-op command handler."""
+    pass
+
+
+_USER_COMMANDS: Final[
+    dict[str, Callable[[ChannelChatMessageEventSub, str], Awaitable[None]]]
+] = {
+    "lurk": lurk,
+    "discord": discord_command,
+    "kofi": kofi,
+    "raid": raid,
+    "socials": socials,
+    "throne": throne,
+    "unlurk": unlurk,
+    "hug": hug,
+    "so": shoutout,
+    "everything": everything,
+}
+
+
+def _is_chat_command(body: dict[str, Any]) -> bool:
+    """Check the raw payload for a command sent in the broadcaster's own chat."""
+    event: dict[str, Any] = body.get("event") or {}
+    text: str = (event.get("message") or {}).get("text", "")
+    if not text.startswith("!"):
+        return False
+    source_broadcaster_user_id = event.get("source_broadcaster_user_id")
+    return (
+        source_broadcaster_user_id is None
+        or source_broadcaster_user_id == event.get("broadcaster_user_id")
+    )
+
+
 async def _channel_chat_message_task(event_sub: ChannelChatMessageEventSub) -> None:
-    user_command_dict: dict[
-        str, Callable[[ChannelChatMessageEventSub, str], Awaitable[None]]
-    ] = {
-        "lurk": lurk,
-        "discord": discord_command,
-        "kofi": kofi,
-        "raid": raid,
-        "socials": socials,
-        "throne": throne,
-        "unlurk": unlurk,
-        "hug": hug,
-        "so": shoutout,
-        "everything": everything,
-    }
     try:
-        if not event_sub.event.message.text.startswith("!"):
-            return None
-        text_without_prefix = event_sub.event.message.text[1:]
-        command_parts = text_without_prefix.split(" ", 1)
-        command = command_parts[0].lower()
-        args = command_parts[1] if len(command_parts) > 1 else ""
-
-        if (
-            event_sub.event.source_broadcaster_user_id is not None
-            and event_sub.event.source_broadcaster_user_id
-            != event_sub.event.broadcaster_user_id
-        ):
-            return None
-
-        async def default_command(
-            event_sub: ChannelChatMessageEventSub, args: str
-        ) -> None:
-            """Default no-op command handler."""
-            pass
+        command, _, args = event_sub.event.message.text[1:].partition(" ")
+        if not command.islower():
+            command = command.lower()
 
-        await user_command_dict.get(command, default_command)(event_sub, args)
+        await _USER_COMMANDS.get(command, _default_command)(event_sub, args)
     except Exception as e:
         await handle_error(e, "Error processing Twitch chat webhook task")
 
@@ -572,7 +676,10 @@ async def _channel_ad_break_begin_task(event_sub: ChannelAdBreakBeginEventSub) -
         broadcaster_id = event_sub.event.broadcaster_user_id
         _cancel_task_if_exists(_ad_break_notification_tasks, broadcaster_id)
 
-        task = asyncio.create_task(_schedule_next_ad_break_notification(broadcaster_id))
+        task = asyncio.create_task(
+            _schedule_next_ad_break_notification(broadcaster_id),
+            name=f"ad-break-{broadcaster_id}",
+        )
         _register_ad_break_task(broadcaster_id, task)
     except Exception as e:
         await handle_error(e, "Error processing Twitch ad break webhook task")
@@ -582,7 +689,7 @@ async def _oauth_callback_common(
     code: str, state: str, endpoint: str
 ) -> RefreshResponse:
     if state != TWITCH_WEBHOOK_SECRET:
-        logger.warning(f"400: Bad request. Invalid state: {state}")
+        logger.warning("400: Bad request. Invalid state: %s", state)
         await send_message(
             f"400: Bad request on {endpoint}. Invalid state.",
             BOT_ADMIN_CHANNEL,
@@ -602,7 +709,9 @@ async def _oauth_callback_common(
 
     if response.status_code < 200 or response.status_code >= 300:
         logger.error(
-            f"Token exchange failed with status={response.status_code}, response={response.text}"
+            "Token exchange failed with status=%s, response=%s",
+            response.status_code,
+            response.text,
         )
         await send_message(
             f"Failed to exchange token: {response.status_code} {response.text}",
@@ -610,10 +719,10 @@ async def _oauth_callback_common(
         )
         raise HTTPException(status_code=500)
 
-    auth_response = RefreshResponse.model_validate(response.json())
+    auth_response = RefreshResponse.model_validate_json(response.content)
     if auth_response.token_type != "bearer":
         logger.error(
-            f"Token exchange failed: unexpected token type {auth_response.token_type}"
+            "Token exchange failed: unexpected token type %s", auth_response.token_type
         )
         await send_message(
             f"Failed to exchange token: unexpected token type {auth_response.token_type}",
@@ -689,6 +798,7 @@ async def channel_chat_message_webhook(request: Request) -> Response:
         ChannelChatMessageEventSub,
         "channel.chat.message",
         _channel_chat_message_task,
+        _is_chat_command,
     )
 
 
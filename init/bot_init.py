@@ -1,25 +1,28 @@
 import asyncio
+import hashlib
 import logging
 import os
+from typing import Optional
 
+import aiofiles
 import discord
+import orjson
 import polars as pl
 from discord import CategoryChannel, ForumChannel
-from discord.abc import PrivateChannel
+from discord.abc import GuildChannel, Messageable, PrivateChannel
 from discord.ext.commands import Bot
-from dotenv import load_dotenv
 
 from constants import (
     BOT_ADMIN_CHANNEL,
+    COMMAND_TREE_HASH_FILE,
     GUILD_ID,
     LIVE_ALERTS,
     PARQUET_SCHEMAS,
     TWITCH_DIR,
 )
+from services.helper.background import run_in_background
 from services.helper.parquet_cache import parquet_cache
 
-load_dotenv()
-
 logger = logging.getLogger(__name__)
 
 MY_GUILD = discord.Object(id=GUILD_ID)
@@ -31,23 +34,27 @@ async def restart_live_alert_tasks() -> None:
     from services import read_parquet_cached, update_alert
 
     df = await read_parquet_cached(LIVE_ALERTS)
-
-    for alert in df.iter_rows(named=True):
-        broadcaster_id = alert["id"]
-        channel_id = alert["channel_id"]
-        message_id = alert["message_id"]
-        stream_id = alert["stream_id"]
-        stream_started_at = alert["stream_started_at"]
-        _ = asyncio.create_task(
+    # A missing file loads as a frame without columns, so check before reading them
+    if df.is_empty():
+        return None
+    columns = ("id", "channel_id", "message_id", "stream_id", "stream_started_at")
+    for (
+        broadcaster_id,
+        channel_id,
+        message_id,
+        stream_id,
+        stream_started_at,
+    ) in zip(*(df.get_column(column).to_list() for column in columns)):
+        run_in_background(
             update_alert(
                 broadcaster_id=broadcaster_id,
                 channel_id=channel_id,
                 message_id=message_id,
                 stream_id=stream_id,
                 stream_started_at=stream_started_at,
-            )
+            ),
+            name=f"live-alert-{broadcaster_id}",
         )
-        await asyncio.sleep(1)
 
 
 async def activate_if_live() -> None:
@@ -59,40 +66,67 @@ async def activate_if_live() -> None:
 
     stream_info = await get_stream_info(int(TWITCH_BROADCASTER_ID))
     if stream_info and stream_info.type == "live":
-        _ = asyncio.create_task(shoutout_queue.activate())
+        run_in_background(shoutout_queue.activate(), name="shoutout-queue")
 
 
 def check_data_files_exist() -> None:
     os.makedirs(TWITCH_DIR, exist_ok=True)
+    # One listdir per parent directory instead of a stat per file
+    existing_files: dict[str, set[str]] = {}
     for file_path, schema in PARQUET_SCHEMAS.items():
-        if not os.path.isfile(file_path):
+        parent_dir, file_name = os.path.split(file_path)
+        if parent_dir not in existing_files:
             # Create parent directories if they don't exist
-            if parent_dir := os.path.dirname(file_path):
+            if parent_dir:
                 os.makedirs(parent_dir, exist_ok=True)
+            existing_files[parent_dir] = set(os.listdir(parent_dir or "."))
+        if file_name in existing_files[parent_dir]:
+            continue
 
-            # Create empty file to ensure write_parquet can write to it
-            open(file_path, "w").close()
-
-            empty_df = pl.DataFrame(schema=schema)
-            empty_df.write_parquet(file_path)
+        # Create empty file to ensure write_parquet can write to it
+        open(file_path, "w").close()
 
-
-async def run_background_tasks():
-    await asyncio.gather(
-        restart_live_alert_tasks(), activate_if_live(), return_exceptions=True
-    )
+        empty_df = pl.DataFrame(schema=schema)
+        empty_df.write_parquet(file_path, compression="uncompressed")
 
 
 class MyBot(Bot):
     def __init__(self, *, command_prefix: str, intents: discord.Intents) -> None:
         super().__init__(command_prefix=command_prefix, intents=intents)
-        self.case_insensitive = True
+        self.started = False
+        self.messageable_channels: dict[int, Messageable] = {}
+
+    def get_messageable(self, channel_id: int) -> Optional[Messageable]:
+        """Resolve a sendable channel once, then serve it from a dict keyed by id."""
+        channel = self.messageable_channels.get(channel_id)
+        if channel is None:
+            resolved = self.get_channel(channel_id)
+            if resolved is None or isinstance(
+                resolved, (ForumChannel, CategoryChannel, PrivateChannel)
+            ):
+                return None
+            channel = self.messageable_channels[channel_id] = resolved
+        return channel
+
+    def get_admin_channel(self) -> Optional[Messageable]:
+        return self.get_messageable(BOT_ADMIN_CHANNEL)
+
+    async def on_message(self, message: discord.Message) -> None:
+        # Every command is an app command, so skip prefix parsing per message.
+        # Cog on_message listeners are dispatched separately and still run.
+        return None
+
+    async def on_guild_channel_delete(self, channel: GuildChannel) -> None:
+        self.messageable_channels.pop(channel.id, None)
+
+    async def on_thread_delete(self, thread: discord.Thread) -> None:
+        self.messageable_channels.pop(thread.id, None)
 
     async def setup_hook(self) -> None:
         parquet_cache.start()
 
         self.tree.copy_global_to(guild=MY_GUILD)
-        await self.tree.sync(guild=MY_GUILD)
+        await self._sync_tree_if_changed()
 
         from views import (
             DMsOpenView,
@@ -104,30 +138,73 @@ class MyBot(Bot):
         )
 
         # register all persistent Views so buttons still work after a restart
-        self.add_view(RulesView())
-        self.add_view(PingRolesView())
-        self.add_view(NSFWAccessView())
-        self.add_view(PronounRolesView())
-        self.add_view(OtherRolesView())
-        self.add_view(DMsOpenView())
+        for view in (
+            RulesView(),
+            PingRolesView(),
+            NSFWAccessView(),
+            PronounRolesView(),
+            OtherRolesView(),
+            DMsOpenView(),
+        ):
+            self.add_view(view)
+
+    async def _sync_tree_if_changed(self) -> None:
+        """Sync guild commands only when their payload differs from the last sync."""
+        payload = [
+            command.to_dict(self.tree)
+            for command in self.tree.get_commands(guild=MY_GUILD)
+        ]
+        tree_hash = hashlib.blake2b(
+            orjson.dumps(payload, option=orjson.OPT_SORT_KEYS, default=str)
+        ).hexdigest()
+
+        try:
+            async with aiofiles.open(COMMAND_TREE_HASH_FILE, "r") as f:
+                if (await f.read()).strip() == tree_hash:
+                    return None
+        except FileNotFoundError:
+            pass
+
+        await self.tree.sync(guild=MY_GUILD)
+        os.makedirs(os.path.dirname(COMMAND_TREE_HASH_FILE), exist_ok=True)
+        async with aiofiles.open(COMMAND_TREE_HASH_FILE, "w") as f:
+            await f.write(tree_hash)
 
     async def close(self) -> None:
         await parquet_cache.stop()
         await super().close()
 
 
-bot = MyBot(command_prefix="$", intents=discord.Intents.all())
+# Only the gateway events the cogs handle: members for joins/updates and the
+# member cache, messages and their content for the message log and the
+# trigger-word replies in Events.on_message, moderation for bans and invites
+# for the audit log.
+bot = MyBot(
+    command_prefix="$",
+    intents=discord.Intents(
+        guilds=True,
+        members=True,
+        messages=True,
+        message_content=True,
+        moderation=True,
+        invites=True,
+    ),
+)
 
 
 @bot.event
 async def on_ready() -> None:
-    check_data_files_exist()
+    # on_ready fires again after every reconnect; only start up once
+    if bot.started:
+        return None
+    bot.started = True
+
+    await asyncio.to_thread(check_data_files_exist)
 
-    _ = asyncio.create_task(run_background_tasks())
+    run_in_background(restart_live_alert_tasks(), name="restart-live-alerts")
+    run_in_background(activate_if_live(), name="activate-if-live")
 
-    channel = bot.get_channel(BOT_ADMIN_CHANNEL)
-    if channel is None or isinstance(
-        channel, (ForumChannel, CategoryChannel, PrivateChannel)
-    ):
+    channel = bot.get_admin_channel()
+    if channel is None:
         return None
     await channel.send("Started successfully!")
@@ -3,15 +3,23 @@ import truststore
 truststore.inject_into_ssl()
 
 
+from dotenv import load_dotenv
+
+# Load .env once, before any project module reads its settings at import time
+load_dotenv()
+
+
 import asyncio
+import atexit
 import logging
 import os
+import queue
 import traceback
 from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
 
-from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, Response
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, HTTPException, Request, Response
 from rich.logging import RichHandler
 
 from constants import COGS, ErrorDetails
@@ -19,25 +27,39 @@ from controller import twitch_router
 from init import bot
 from services.helper.http_client import http_client_manager
 
-load_dotenv()
-
-
+# The path column is computed for every record and adds nothing here
+console_handler = RichHandler(show_path=False)
+console_handler.setFormatter(logging.Formatter("%(message)s", datefmt="[%X]"))
+# Rich renders and writes to the console on the listener's thread, so a slow
+# console never blocks the event loop shared by the webhooks and the bot
+log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+log_listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
 logging.basicConfig(
-    level=logging.INFO, format="%(message)s", datefmt="[%X]", handlers=[RichHandler()]
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    format="%(message)s",
+    handlers=[QueueHandler(log_queue)],
 )
+log_listener.start()
+atexit.register(log_listener.stop)
 logger = logging.getLogger(__name__)
 logging.getLogger("httpx").setLevel(logging.WARNING)
+logging.getLogger("discord").setLevel(logging.WARNING)
 
 
 DISCORD_TOKEN = os.getenv("DISCORD_TOKEN")
 
+# Served from memory; read once at startup instead of on every crawler hit
+STATIC_FILES = {"robots.txt": "text/plain", "favicon.ico": "image/x-icon"}
+
 
 def get_error_details(e: Exception) -> ErrorDetails:
     return {
         "type": type(e).__name__,
         "message": str(e),
         "args": e.args,
-        "traceback": traceback.format_exc(),
+        # Format e itself: exceptions returned by asyncio.gather were never
+        # raised here, so format_exc() would only see "NoneType: None"
+        "traceback": "".join(traceback.format_exception(e)),
     }
 
 
@@ -72,7 +94,11 @@ async def main() -> None:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    _ = asyncio.create_task(main())
+    await http_client_manager.get_client()
+    app.state.static_files = {
+        filename: load_static_file(filename) for filename in STATIC_FILES
+    }
+    _ = asyncio.create_task(main(), name="bot-bootstrap")
     yield
     await http_client_manager.close()
 
@@ -81,30 +107,40 @@ app = FastAPI(lifespan=lifespan)
 app.include_router(twitch_router)
 
 
-def static_file_response(filename: str) -> Response:
+def load_static_file(filename: str) -> Optional[bytes]:
     if not os.path.exists(filename):
-        logger.warning(f"{filename} file not found, returning empty response")
+        return None
+    with open(filename, "rb") as f:
+        return f.read()
+
+
+def static_file_response(request: Request, filename: str) -> Response:
+    content = request.app.state.static_files.get(filename)
+    if content is None:
+        logger.warning("%s file not found, returning empty response", filename)
         raise HTTPException(status_code=404)
-    return FileResponse(filename)
+    return Response(
+        content,
+        media_type=STATIC_FILES[filename],
+        headers={"Cache-Control": "public, max-age=86400"},
+    )
 
 
 @app.get("/")
 @app.get("/health")
 async def root_or_health() -> Response:
-    # Both endpoints return 204, health returns a message
-    if "health" in str(root_or_health.__name__):
-        return Response("Health check OK", status_code=204)
+    # 204 carries no body, so liveness probes cost only a status line
     return Response(status_code=204)
 
 
 @app.get("/robots.txt")
-async def robots_txt() -> Response:
-    return static_file_response("robots.txt")
+async def robots_txt(request: Request) -> Response:
+    return static_file_response(request, "robots.txt")
 
 
 @app.get("/favicon.ico")
-async def favicon() -> Response:
-    return static_file_response("favicon.ico")
+async def favicon(request: Request) -> Response:
+    return static_file_response(request, "favicon.ico")
 
 
 if __name__ == "__main__":
@@ -114,6 +150,9 @@ if __name__ == "__main__":
         app,
         host="0.0.0.0",
         port=8000,
+        # uvloop where the platform has it (not on Windows), httptools always
+        loop="auto",
+        http="httptools",
         log_level="info",
         access_log=True,
         log_config=None,
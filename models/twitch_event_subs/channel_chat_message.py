@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import Literal, Optional
 
 from pydantic import BaseModel
@@ -59,6 +60,10 @@ class ChannelChatMessageEvent(BaseModel):
     source_badges: Optional[list[Badge]]
     is_source_only: Optional[bool]
 
+    @cached_property
+    def badge_set_ids(self) -> frozenset[str]:
+        return frozenset(badge.set_id for badge in self.badges)
+
 
 class ChannelChatMessageEventSub(BaseModel):
     subscription: ChannelChatMessageSubscription
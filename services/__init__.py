@@ -1,3 +1,4 @@
+from .helper.background import run_in_background
 from .helper.helper import (
     delete_row_from_parquet,
     edit_embed,
@@ -12,8 +13,9 @@ from .helper.helper import (
     get_ordinal_suffix,
     get_pfp,
     is_leap,
-    parse_rfc3339,
+    is_signature_well_formed,
     read_parquet_cached,
+    read_row_from_parquet,
     roles_button_pressed,
     send_embed,
     send_message,
@@ -63,9 +65,11 @@ __all__ = [
     "get_ordinal_suffix",
     "get_pfp",
     "is_leap",
-    "parse_rfc3339",
+    "is_signature_well_formed",
     "read_parquet_cached",
+    "read_row_from_parquet",
     "roles_button_pressed",
+    "run_in_background",
     "send_embed",
     "send_message",
     "toggle_role",
@@ -0,0 +1,60 @@
+import asyncio
+import io
+import logging
+import traceback
+from typing import Any, Coroutine
+
+import discord
+
+from constants import BOT_ADMIN_CHANNEL, ErrorDetails
+
+logger = logging.getLogger(__name__)
+
+# The event loop only holds weak references to tasks, so keep fire-and-forget
+# work alive here until it finishes
+_background_tasks: set[asyncio.Task] = set()
+
+
+def run_in_background(coro: Coroutine[Any, Any, Any], name: str | None = None) -> None:
+    """Run a coroutine as a tracked task and report any exception it raises."""
+    task = asyncio.create_task(coro, name=name)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_background_task_done)
+
+
+def _on_background_task_done(task: asyncio.Task) -> None:
+    _background_tasks.discard(task)
+    if task.cancelled():
+        return None
+    exception = task.exception()
+    if not isinstance(exception, Exception):
+        return None
+    # Reporting posts to Discord, so it runs as its own tracked task. If that
+    # fails too, only log it rather than reporting the report.
+    report = asyncio.create_task(_report_task_error(task.get_name(), exception))
+    _background_tasks.add(report)
+    report.add_done_callback(_on_report_task_done)
+
+
+def _on_report_task_done(task: asyncio.Task) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Failed to report background task error: %s", task.exception())
+
+
+async def _report_task_error(task_name: str, e: Exception) -> None:
+    from services.helper.helper import send_message
+
+    error_details: ErrorDetails = {
+        "type": type(e).__name__,
+        "message": str(e),
+        "args": e.args,
+        # The task has already finished, so there is no active exception for
+        # format_exc() to see; format the one it raised instead
+        "traceback": "".join(traceback.format_exception(e)),
+    }
+    error_msg = f"Unhandled exception in task {task_name} - Type: {error_details['type']}, Message: {error_details['message']}, Args: {error_details['args']}"
+    logger.error(f"{error_msg}\nTraceback:\n{error_details['traceback']}")
+    traceback_buffer = io.BytesIO(error_details["traceback"].encode("utf-8"))
+    traceback_file = discord.File(traceback_buffer, filename="traceback.txt")
+    await send_message(error_msg, BOT_ADMIN_CHANNEL, file=traceback_file)
@@ -1,11 +1,12 @@
+import calendar
 import hashlib
 import hmac
 import logging
+from datetime import UTC, datetime
 from functools import cache
-from typing import Optional
+from typing import Any, Optional
 
 import discord
-import pendulum
 from discord import (
     CategoryChannel,
     DMChannel,
@@ -27,15 +28,28 @@ from discord import (
 )
 from discord.abc import GuildChannel, PrivateChannel
 from discord.ui import Button, View
-from pendulum import DateTime
 from polars import DataFrame
 
-from constants import EMOJI_ROLE_MAP, USERS, LiveAlert, UserRecord
+from constants import EMOJI_ROLE_MAP, HMAC_PREFIX, USERS, LiveAlert, UserRecord
 from init import bot
 from services.helper.parquet_cache import parquet_cache
 
 logger = logging.getLogger(__name__)
 
+# "sha256=" followed by the 64 hex characters of a SHA-256 digest
+_SIGNATURE_LENGTH = len(HMAC_PREFIX) + 2 * hashlib.sha256().digest_size
+
+# Suffix by n % 100: 11th-13th are irregular, otherwise the last digit decides
+_ORDINAL_SUFFIXES = tuple(
+    "th" if 10 <= i <= 13 else {1: "st", 2: "nd", 3: "rd"}.get(i % 10, "th")
+    for i in range(100)
+)
+
+_UNIT_PLURALS = {
+    unit: f"{unit}s"
+    for unit in ("year", "month", "week", "day", "hour", "minute", "second")
+}
+
 
 def upsert_row_to_parquet(
     row_data: dict | UserRecord | LiveAlert, filepath: str, id_column: str = "id"
@@ -53,13 +67,17 @@ async def read_parquet_cached(filepath: str) -> DataFrame:
     return await parquet_cache.read_df(filepath)
 
 
+async def read_row_from_parquet(
+    id_value: str | int, filepath: str, id_column: str = "id"
+) -> Optional[dict[str, Any]]:
+    return await parquet_cache.read_row(id_value, filepath, id_column)
+
+
 async def send_message(
     content: str, channel_id: int, file: Optional[discord.File] = None
 ) -> Optional[int]:
-    channel = bot.get_channel(channel_id)
-    if channel is None or isinstance(
-        channel, (ForumChannel, CategoryChannel, PrivateChannel)
-    ):
+    channel = bot.get_messageable(channel_id)
+    if channel is None:
         return None
     if file:
         return (await channel.send(content, file=file)).id
@@ -72,10 +90,8 @@ async def send_embed(
     view: Optional[View] = None,
     content: Optional[str] = None,
 ) -> Optional[int]:
-    channel = bot.get_channel(channel_id)
-    if channel is None or isinstance(
-        channel, (ForumChannel, CategoryChannel, PrivateChannel)
-    ):
+    channel = bot.get_messageable(channel_id)
+    if channel is None:
         return None
     if view:
         return (await channel.send(content=content, embed=embed, view=view)).id
@@ -89,10 +105,8 @@ async def edit_embed(
     view: Optional[View] = None,
     content: Optional[str] = None,
 ) -> None:
-    channel = bot.get_channel(channel_id)
-    if channel is None or isinstance(
-        channel, (ForumChannel, CategoryChannel, PrivateChannel)
-    ):
+    channel = bot.get_messageable(channel_id)
+    if channel is None:
         return None
     message = await channel.fetch_message(message_id)
     if view:
@@ -102,11 +116,14 @@ async def edit_embed(
 
 
 def get_pfp(member: User | Member) -> str:
-    return member.avatar.url if member.avatar else member.default_avatar.url
+    # Member.avatar builds a new Asset on every access
+    avatar = member.avatar
+    return avatar.url if avatar else member.default_avatar.url
 
 
 def get_discriminator(member: User | Member) -> str:
-    return "" if member.discriminator == "0" else f"#{member.discriminator}"
+    discriminator = member.discriminator
+    return "" if discriminator == "0" else f"#{discriminator}"
 
 
 def update_birthday(record: UserRecord) -> None:
@@ -142,24 +159,42 @@ def get_channel_mention(
     return f"{channel.mention}"
 
 
-def get_age(date_time: DateTime, limit_units: int = -1) -> str:
-    now = pendulum.now("UTC")
-    age = now - date_time if date_time <= now else date_time - now
+def get_age(date_time: datetime, limit_units: int = -1) -> str:
+    now = datetime.now(UTC)
+    date_time = date_time.astimezone(UTC)
+    start, end = (date_time, now) if date_time <= now else (now, date_time)
 
-    years, months, days, hours, minutes, seconds = (
-        age.years,
-        age.months,
-        age.remaining_days,
-        age.hours,
-        age.minutes,
-        age.remaining_seconds,
-    )
-
-    parts = _get_age_parts(years, months, days, hours, minutes, seconds)
+    parts = _get_age_parts(*_get_calendar_diff(start, end))
     parts = parts[:limit_units] if limit_units > 0 else parts
     return ", ".join(parts)
 
 
+def _add_months(date_time: datetime, months: int) -> datetime:
+    """Shift by whole months, clamping the day to the end of the target month."""
+    year, month = divmod(date_time.month - 1 + months, 12)
+    year += date_time.year
+    day = min(date_time.day, calendar.monthrange(year, month + 1)[1])
+    return date_time.replace(year=year, month=month + 1, day=day)
+
+
+def _get_calendar_diff(
+    start: datetime, end: datetime
+) -> tuple[int, int, int, int, int, int]:
+    """Split the span between two datetimes into calendar units."""
+    total_months = (end.year - start.year) * 12 + end.month - start.month
+    anchor = _add_months(start, total_months)
+    if anchor > end:
+        total_months -= 1
+        anchor = _add_months(start, total_months)
+
+    remainder = end - anchor
+    years, months = divmod(total_months, 12)
+    hours, seconds = divmod(remainder.seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    # Days past the last whole week, matching pendulum's remaining_days
+    return years, months, remainder.days % 7, hours, minutes, seconds
+
+
 def _get_age_parts(
     years: int, months: int, days: int, hours: int, minutes: int, seconds: int
 ) -> list[str]:
@@ -203,66 +238,60 @@ def _get_small_time_units(
     return parts
 
 
-@cache
 def is_leap(year: int) -> bool:
-    return (year % 400 == 0) or (year % 100 != 0) and (year % 4 == 0)
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
 
 
-@cache
 def get_next_leap(year: int) -> int:
-    while not is_leap(year):
-        year += 1
-    return year
+    # Only multiples of 4 can be leap years, and a skipped century year is
+    # always followed by a leap year four years later
+    year += -year % 4
+    return year if is_leap(year) else year + 4
 
 
-@cache
 def get_ordinal_suffix(n: int) -> str:
-    if 10 <= n % 100 <= 13:
-        return f"{n}th"
-    last_digit = n % 10
-    if last_digit == 1:
-        return f"{n}st"
-    elif last_digit == 2:
-        return f"{n}nd"
-    elif last_digit == 3:
-        return f"{n}rd"
-    return f"{n}th"
+    return f"{n}{_ORDINAL_SUFFIXES[n % 100]}"
 
 
-@cache
 def format_unit(value: int, unit: str) -> str:
-    return f"{value} {f'{unit}s' if value != 1 else unit}"
+    return f"{value} {unit if value == 1 else _UNIT_PLURALS[unit]}"
 
 
-@cache
 def get_hmac_message(
-    twitch_message_id: str, twitch_message_timestamp: str, body: str
-) -> str:
-    return twitch_message_id + twitch_message_timestamp + body
+    twitch_message_id: str, twitch_message_timestamp: str, body: bytes
+) -> bytes:
+    return b"".join(
+        (
+            twitch_message_id.encode("utf-8"),
+            twitch_message_timestamp.encode("utf-8"),
+            body,
+        )
+    )
 
 
 @cache
-def get_hmac(secret: str, message: str) -> str:
-    return hmac.new(
-        secret.encode("utf-8"), message.encode("utf-8"), hashlib.sha256
-    ).hexdigest()
+def _get_hmac_template(secret: str) -> hmac.HMAC:
+    return hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
 
 
-@cache
-def verify_message(hmac_str: str, verify_signature: str) -> bool:
-    return hmac.compare_digest(hmac_str, verify_signature)
+def get_hmac(secret: str, message: bytes) -> bytes:
+    hmac_obj = _get_hmac_template(secret).copy()
+    hmac_obj.update(message)
+    return hmac_obj.digest()
 
 
-@cache
-def parse_rfc3339(date_str: str) -> DateTime:
-    """
-    Parse an RFC3339 / ISO-8601 timestamp (e.g. '2025-05-31T12:34:56Z')
-    and return a timezone-aware DateTime.
-    """
-    parsed = pendulum.parse(date_str)
-    if not isinstance(parsed, DateTime):
-        raise ValueError(f"Expected DateTime string, got: {date_str}")
-    return parsed
+def is_signature_well_formed(signature: str) -> bool:
+    return len(signature) == _SIGNATURE_LENGTH and signature.startswith(HMAC_PREFIX)
+
+
+def verify_message(hmac_digest: bytes, verify_signature: str) -> bool:
+    if not verify_signature.startswith(HMAC_PREFIX):
+        return False
+    try:
+        signature = bytes.fromhex(verify_signature[len(HMAC_PREFIX) :])
+    except ValueError:
+        return False
+    return hmac.compare_digest(hmac_digest, signature)
 
 
 def get_member_role(
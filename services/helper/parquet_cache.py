@@ -21,13 +21,16 @@ class ParquetCache:
         )
         self._id_columns: Dict[str, str] = {}
         self._lock = Lock()
+        self._write_lock = Lock()
         self._flush_interval = flush_interval
         self._flush_task: Optional[asyncio.Task] = None
 
     def start(self):
         """Start the periodic flush task"""
         if self._flush_task is None:
-            self._flush_task = asyncio.create_task(self._periodic_flush())
+            self._flush_task = asyncio.create_task(
+                self._periodic_flush(), name="parquet-flush"
+            )
 
     async def stop(self):
         """Stop and flush any remaining data"""
@@ -44,7 +47,7 @@ class ParquetCache:
             except asyncio.CancelledError:
                 raise
             except Exception as e:
-                logger.error(f"Error in periodic flush: {e}")
+                logger.error("Error in periodic flush: %s", e)
 
     async def _force_flush(self):
         """Force flush all dirty data"""
@@ -56,19 +59,23 @@ class ParquetCache:
             try:
                 await self._flush_file(filepath)
             except Exception as e:
-                logger.error(f"Error flushing {filepath}: {e}")
+                logger.error("Error flushing %s: %s", filepath, e)
 
     async def _flush_file(self, filepath: str):
         """Flush a specific file's changes"""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         await loop.run_in_executor(None, self._flush_file_sync, filepath)
 
     def _flush_file_sync(self, filepath: str):
         """Synchronously flush file changes"""
-        with self._lock:
-            df = self._ensure_dataframe_loaded(filepath)
-            df = self._apply_pending_changes(filepath, df)
-            self._save_dataframe(filepath, df)
+        # Only the in-memory merge holds the state lock, so upserts from the
+        # event loop never wait on the disk write itself
+        with self._write_lock:
+            with self._lock:
+                df = self._ensure_dataframe_loaded(filepath)
+                df = self._apply_pending_changes(filepath, df)
+                self._cache[filepath] = df
+            df.write_parquet(filepath)
 
     def _ensure_dataframe_loaded(self, filepath: str) -> pl.DataFrame:
         """Ensure DataFrame is loaded into cache"""
@@ -119,11 +126,6 @@ class ParquetCache:
         self._pending_writes[filepath].clear()
         return df
 
-    def _save_dataframe(self, filepath: str, df: pl.DataFrame):
-        """Save DataFrame to cache and file"""
-        self._cache[filepath] = df
-        df.write_parquet(filepath)
-
     def upsert_row(
         self,
         row_data: dict | UserRecord | LiveAlert,
@@ -149,18 +151,41 @@ class ParquetCache:
 
     async def read_df(self, filepath: str) -> pl.DataFrame:
         """Read DataFrame with cache"""
+        df = await self._get_cached_df(filepath)
+        return df.clone()
+
+    async def read_row(
+        self, id_value: Any, filepath: str, id_column: str = "id"
+    ) -> Optional[Dict[str, Any]]:
+        """Look up a single row by id, including changes not yet flushed"""
+        with self._lock:
+            pending_writes = self._pending_writes.get(filepath)
+            if pending_writes and id_value in pending_writes:
+                return dict(pending_writes[id_value])
+            pending_deletes = self._pending_deletes.get(filepath)
+            if pending_deletes and id_value in pending_deletes.get(id_column, ()):
+                return None
+
+        df = await self._get_cached_df(filepath)
+        if df.is_empty() or id_column not in df.columns:
+            return None
+        rows = df.filter(pl.col(id_column) == id_value)
+        return rows.row(0, named=True) if rows.height else None
+
+    async def _get_cached_df(self, filepath: str) -> pl.DataFrame:
+        """Return the cached DataFrame, loading it from disk on first use"""
         with self._lock:
             if filepath in self._cache:
-                return self._cache[filepath].clone()
+                return self._cache[filepath]
 
         # Load from file if not in cache
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         df = await loop.run_in_executor(None, self._load_file, filepath)
 
         with self._lock:
             self._cache[filepath] = df
 
-        return df.clone()
+        return df
 
     def _load_file(self, filepath: str) -> pl.DataFrame:
         """Load file from disk"""
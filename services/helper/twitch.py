@@ -1,11 +1,14 @@
+import asyncio
 import io
 import logging
 import os
+import time
 import traceback
+from collections import defaultdict, deque
 from typing import Literal, Optional
 
 import discord
-from dotenv import load_dotenv
+import orjson
 from httpx import Response
 
 from constants import (
@@ -18,13 +21,18 @@ from services.helper.helper import send_message
 from services.helper.http_client import http_client_manager, is_transient_network_error
 from services.twitch.token_manager import token_manager
 
-load_dotenv()
-
 logger = logging.getLogger(__name__)
 
 TWITCH_CLIENT_ID = os.getenv("TWITCH_CLIENT_ID")
 TWITCH_BOT_USER_ID = os.getenv("TWITCH_BOT_USER_ID")
 
+_MOD_BADGES = frozenset(("moderator", "broadcaster"))
+
+# Twitch: 20 chat messages per 30 seconds per channel for a non-moderator sender.
+_CHAT_RATE_LIMIT = 20
+_CHAT_RATE_WINDOW_SECONDS = 30.0
+_chat_send_times: defaultdict[str, deque[float]] = defaultdict(deque)
+
 
 async def log_error(message: str, traceback_str: str) -> None:
     traceback_buffer = io.BytesIO(traceback_str.encode("utf-8"))
@@ -75,13 +83,17 @@ async def _make_http_request(
             "GET", url, headers=headers, params=json
         )
     elif method.upper() == "POST":
+        # Serialise with orjson rather than letting httpx fall back to stdlib json
         return await http_client_manager.request(
-            "POST", url, headers=headers, json=json
+            "POST",
+            url,
+            headers={**headers, "Content-Type": "application/json"},
+            content=orjson.dumps(json) if json is not None else None,
         )
     elif method.upper() == "DELETE":
         return await http_client_manager.request("DELETE", url, headers=headers)
     else:
-        logger.error(f"Unsupported HTTP method: {method}")
+        logger.error("Unsupported HTTP method: %s", method)
         await send_message(f"Unsupported HTTP method: {method}", BOT_ADMIN_CHANNEL)
         return None
 
@@ -158,11 +170,9 @@ async def call_twitch(
 
 
 async def check_mod(event_sub: ChannelChatMessageEventSub) -> bool:
-    has_mod = any(
-        badge.set_id in {"moderator", "broadcaster"}
-        for badge in event_sub.event.badges or []
-    )
-    broadcaster_id = event_sub.event.broadcaster_user_id
+    event = event_sub.event
+    has_mod = not event.badge_set_ids.isdisjoint(_MOD_BADGES)
+    broadcaster_id = event.broadcaster_user_id
     if not has_mod:
         message = "Only moderators can use this command."
         await twitch_send_message(broadcaster_id, message)
@@ -170,8 +180,22 @@ async def check_mod(event_sub: ChannelChatMessageEventSub) -> bool:
     return True
 
 
+async def _wait_for_chat_slot(broadcaster_id: str) -> None:
+    """Wait until another chat message fits in the channel's rate limit window."""
+    sent = _chat_send_times[broadcaster_id]
+    while True:
+        now = time.monotonic()
+        while sent and now - sent[0] >= _CHAT_RATE_WINDOW_SECONDS:
+            sent.popleft()
+        if len(sent) < _CHAT_RATE_LIMIT:
+            sent.append(now)
+            return None
+        await asyncio.sleep(_CHAT_RATE_WINDOW_SECONDS - (now - sent[0]))
+
+
 async def twitch_send_message(broadcaster_id: str, message: str) -> None:
     try:
+        await _wait_for_chat_slot(broadcaster_id)
         url = "https://api.twitch.tv/helix/chat/messages"
         data = {
             "broadcaster_id": broadcaster_id,
@@ -186,7 +210,8 @@ async def twitch_send_message(broadcaster_id: str, message: str) -> None:
             or response.status_code >= 300
         ):
             logger.warning(
-                f"Failed to send message: {response.status_code if response else 'No response'}"
+                "Failed to send message: %s",
+                response.status_code if response else "No response",
             )
             await send_message(
                 f"Failed to send message: {response.status_code if response else 'No response'} {response.text if response else ''}",
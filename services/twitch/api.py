@@ -4,20 +4,20 @@ import itertools
 import logging
 import os
 import traceback
+from datetime import datetime
 from typing import Any, Awaitable, Callable, List, Literal, Optional, TypeVar
 
 import discord
 import pendulum
-import polars as pl
 from discord.ui import View
-from dotenv import load_dotenv
 
 from constants import (
     BOT_ADMIN_CHANNEL,
     BROADCASTER_USERNAME,
     LIVE_ALERTS,
-    LIVE_ALERTS_ROLE,
+    LIVE_ALERTS_MENTION,
     STREAM_ALERTS_CHANNEL,
+    STREAM_EMBED_COLOR,
     ErrorDetails,
     TokenType,
 )
@@ -39,21 +39,27 @@ from services.helper.helper import (
     delete_row_from_parquet,
     edit_embed,
     get_age,
-    parse_rfc3339,
-    read_parquet_cached,
+    read_row_from_parquet,
     send_message,
 )
 from services.helper.http_client import is_transient_network_error
 from services.helper.twitch import call_twitch
 
-load_dotenv()
-
 logger = logging.getLogger(__name__)
 
 APP_URL = os.getenv("APP_URL")
 TWITCH_WEBHOOK_SECRET = os.getenv("TWITCH_WEBHOOK_SECRET")
 T = TypeVar("T")
 
+# Caps how many live alerts refresh at once, so alerts restarted together
+# don't hit Discord and Helix in a single burst every minute.
+_alert_update_semaphore = asyncio.Semaphore(10)
+
+# Static parts of the live alert embeds, as in the controller's stream
+# embeds. Embed.from_dict keeps references to nested values, so only
+# top-level scalars live here and every nested dict/list is built per update.
+_STREAM_EMBED_TEMPLATE: dict[str, Any] = {"type": "rich", "color": STREAM_EMBED_COLOR}
+
 
 async def log_error(message: str, traceback_str: str) -> None:
     traceback_buffer = io.BytesIO(traceback_str.encode("utf-8"))
@@ -88,7 +94,7 @@ async def _handle_invalid_response(response, context: str) -> None:
     """Handle invalid HTTP responses with standardized logging and reporting."""
     status = response.status_code if response else "No response"
     text = response.text if response else ""
-    logger.warning(f"{context}: {status}")
+    logger.warning("%s: %s", context, status)
     await send_message(f"{context}: {status} {text}", BOT_ADMIN_CHANNEL)
 
 
@@ -116,7 +122,10 @@ async def retry_api_call(
 
                 wait_time = delay * (2**attempt)
                 logger.warning(
-                    f"Server error {response.status_code} on attempt {attempt + 1}, retrying in {wait_time}s"
+                    "Server error %s on attempt %s, retrying in %ss",
+                    response.status_code,
+                    attempt + 1,
+                    wait_time,
                 )
                 await asyncio.sleep(wait_time)
                 continue
@@ -130,7 +139,10 @@ async def retry_api_call(
                 raise
             wait_time = delay * (2**attempt)
             logger.warning(
-                f"Connection error on attempt {attempt + 1}, retrying in {wait_time}s: {e}"
+                "Connection error on attempt %s, retrying in %ss: %s",
+                attempt + 1,
+                wait_time,
+                e,
             )
             await asyncio.sleep(wait_time)
 
@@ -171,7 +183,7 @@ async def _fetch_subscription_batch(
         await _handle_subscription_response_error(response)
         return None
 
-    return SubscriptionResponse.model_validate(response.json())
+    return SubscriptionResponse.model_validate_json(response.content)
 
 
 async def get_subscriptions() -> Optional[List[Subscription]]:
@@ -207,7 +219,7 @@ async def get_user(id: int) -> Optional[User]:
     if response is None or not _is_valid_response(response):
         await _handle_invalid_response(response, "Failed to fetch user info")
         return None
-    user_info_response = UserResponse.model_validate(response.json())
+    user_info_response = UserResponse.model_validate_json(response.content)
     return user_info_response.data[0] if user_info_response.data else None
 
 
@@ -223,7 +235,7 @@ async def get_user_by_username(username: str) -> Optional[User]:
     if response is None or not _is_valid_response(response):
         await _handle_invalid_response(response, "Failed to fetch user info")
         return None
-    user_info_response = UserResponse.model_validate(response.json())
+    user_info_response = UserResponse.model_validate_json(response.content)
     return user_info_response.data[0] if user_info_response.data else None
 
 
@@ -261,7 +273,7 @@ async def twitch_event_subscription(
 async def subscribe_to_user(username: str) -> bool:
     user = await get_user_by_username(username)
     if not user:
-        logger.warning(f"User not found: {username}")
+        logger.warning("User not found: %s", username)
         await send_message(f"User not found: {username}", BOT_ADMIN_CHANNEL)
         return False
 
@@ -296,7 +308,7 @@ async def unsubscribe_to_user(username: str) -> bool:
     """Unsubscribe from online/offline EventSub subscriptions for a user."""
     user = await get_user_by_username(username)
     if not user:
-        logger.warning(f"User not found: {username}")
+        logger.warning("User not found: %s", username)
         await send_message(f"User not found: {username}", BOT_ADMIN_CHANNEL)
         return False
 
@@ -312,7 +324,7 @@ async def unsubscribe_to_user(username: str) -> bool:
     ]
 
     if not matching_subscriptions:
-        logger.info(f"No online/offline subscriptions found for user: {username}")
+        logger.info("No online/offline subscriptions found for user: %s", username)
         return True
 
     results = []
@@ -339,7 +351,7 @@ async def _fetch_user_batch(batch: List[str]) -> Optional[List[User]]:
         await _handle_invalid_response(response, "Failed to fetch users infos")
         return None
 
-    user_info_response = UserResponse.model_validate(response.json())
+    user_info_response = UserResponse.model_validate_json(response.content)
     return user_info_response.data
 
 
@@ -371,7 +383,7 @@ async def get_channel(id: int) -> Optional[Channel]:
     if response is None or not _is_valid_response(response):
         await _handle_invalid_response(response, "Failed to fetch channel info")
         return None
-    channel_info_response = ChannelResponse.model_validate(response.json())
+    channel_info_response = ChannelResponse.model_validate_json(response.content)
     return channel_info_response.data[0] if channel_info_response.data else None
 
 
@@ -387,7 +399,7 @@ async def get_stream_info(broadcaster_id: int) -> Optional[Stream]:
     if response is None or not _is_valid_response(response):
         await _handle_invalid_response(response, "Failed to fetch stream info")
         return None
-    stream_info_response = StreamResponse.model_validate(response.json())
+    stream_info_response = StreamResponse.model_validate_json(response.content)
     return stream_info_response.data[0] if stream_info_response.data else None
 
 
@@ -403,7 +415,7 @@ async def get_stream_vod(user_id: int, stream_id: int) -> Optional[Video]:
     if response is None or not _is_valid_response(response):
         await _handle_invalid_response(response, "Failed to fetch VOD info")
         return None
-    video_info_response = VideoResponse.model_validate(response.json())
+    video_info_response = VideoResponse.model_validate_json(response.content)
     return next(
         (
             video
@@ -428,7 +440,7 @@ async def get_ad_schedule(broadcaster_id: int) -> Optional[AdSchedule]:
     if response is None or not _is_valid_response(response):
         await _handle_invalid_response(response, "Failed to fetch ad schedule")
         return None
-    ad_schedule_response = AdScheduleResponse.model_validate(response.json())
+    ad_schedule_response = AdScheduleResponse.model_validate_json(response.content)
     return ad_schedule_response.data[0] if ad_schedule_response.data else None
 
 
@@ -486,6 +498,14 @@ def _get_game_name(stream_info: Optional[Stream], channel: Optional[Channel]) ->
     return channel.game_name if channel else "Unknown"
 
 
+def _get_embed_author(name: str, user_info: Optional[User], url: str) -> dict[str, str]:
+    """Build the raw embed author payload, omitting the icon when unknown."""
+    author = {"name": name, "url": url}
+    if user_info:
+        author["icon_url"] = user_info.profile_image_url
+    return author
+
+
 def _create_offline_embed(
     stream_info: Optional[Stream],
     vod_info: Optional[Video],
@@ -496,34 +516,36 @@ def _create_offline_embed(
     now: pendulum.DateTime,
 ) -> discord.Embed:
     """Create the offline embed with all necessary information."""
-    embed = (
-        discord.Embed(
-            description=f"**{_get_stream_title(stream_info, vod_info, channel)}**",
-            color=0x9046FF,
-            timestamp=now,
-        )
-        .set_author(
-            name=f"{_get_user_name(stream_info, user_info)} was live",
-            icon_url=user_info.profile_image_url if user_info else None,
-            url=url,
-        )
-        .add_field(
-            name="**Game**",
-            value=_get_game_name(stream_info, channel),
-            inline=True,
-        )
-        .set_footer(
-            text=f"Online for {age} | Offline at",
-        )
-    )
-
+    fields = [
+        {
+            "name": "**Game**",
+            "value": _get_game_name(stream_info, channel),
+            "inline": True,
+        }
+    ]
     if vod_info:
-        embed = embed.add_field(
-            name="**VOD**",
-            value=f"[**Click to view**]({vod_info.url})",
-            inline=True,
+        fields.append(
+            {
+                "name": "**VOD**",
+                "value": f"[**Click to view**]({vod_info.url})",
+                "inline": True,
+            }
         )
 
+    embed = discord.Embed.from_dict(
+        _STREAM_EMBED_TEMPLATE
+        | {
+            "description": f"**{_get_stream_title(stream_info, vod_info, channel)}**",
+            "author": _get_embed_author(
+                f"{_get_user_name(stream_info, user_info)} was live", user_info, url
+            ),
+            "fields": fields,
+            "footer": {"text": f"Online for {age} | Offline at"},
+        }
+    )
+    # Set the datetime directly; a timestamp in the payload would be
+    # formatted to a string only for from_dict to parse it back
+    embed.timestamp = now
     return embed
 
 
@@ -533,7 +555,8 @@ async def _handle_embed_edit_error(
     """Handle errors that occur during embed editing."""
     if isinstance(e, discord.NotFound):
         logger.warning(
-            f"Message not found when editing offline embed for message_id={message_id}; aborting"
+            "Message not found when editing offline embed for message_id=%s; aborting",
+            message_id,
         )
         try:
             delete_row_from_parquet(broadcaster_id, LIVE_ALERTS)
@@ -558,7 +581,9 @@ async def _handle_embed_edit_error(
 
         if is_transient:
             logger.warning(
-                f"Transient network error when editing offline embed for message_id={message_id}: {e}"
+                "Transient network error when editing offline embed for message_id=%s: %s",
+                message_id,
+                e,
             )
         else:
             # Only log non-transient errors to admin channel
@@ -600,9 +625,7 @@ async def trigger_offline_sequence(
 
 async def _validate_alert_exists(broadcaster_id: int) -> Optional[dict]:
     """Check if alert record exists and return it."""
-    df = await read_parquet_cached(LIVE_ALERTS)
-    alert_row = df.filter(pl.col("id") == broadcaster_id)
-    return None if alert_row.height == 0 else alert_row.row(0, named=True)
+    return await read_row_from_parquet(broadcaster_id, LIVE_ALERTS)
 
 
 def _should_trigger_offline_sequence(
@@ -628,37 +651,36 @@ def _create_live_embed(
     raw_thumb_url = stream_info.thumbnail_url.replace("{width}x{height}", "400x225")
     cache_busted_thumb_url = f"{raw_thumb_url}?cb={int(pendulum.now().timestamp())}"
 
-    return (
-        discord.Embed(
-            description=f"[**{stream_info.title}**]({url})",
-            color=0x9046FF,
-            timestamp=now,
-        )
-        .set_author(
-            name=f"{stream_info.user_name} is now live!",
-            icon_url=user_info.profile_image_url if user_info else None,
-            url=url,
-        )
-        .add_field(
-            name="**Game**",
-            value=f"{stream_info.game_name}",
-            inline=True,
-        )
-        .add_field(
-            name="**Viewers**",
-            value=f"{stream_info.viewer_count}",
-            inline=True,
-        )
-        .add_field(
-            name="**Started At**",
-            value=started_at_timestamp,
-            inline=True,
-        )
-        .set_image(url=cache_busted_thumb_url)
-        .set_footer(
-            text=f"Online for {age} | Last updated",
-        )
+    embed = discord.Embed.from_dict(
+        _STREAM_EMBED_TEMPLATE
+        | {
+            "description": f"[**{stream_info.title}**]({url})",
+            "author": _get_embed_author(
+                f"{stream_info.user_name} is now live!", user_info, url
+            ),
+            "fields": [
+                {
+                    "name": "**Game**",
+                    "value": f"{stream_info.game_name}",
+                    "inline": True,
+                },
+                {
+                    "name": "**Viewers**",
+                    "value": f"{stream_info.viewer_count}",
+                    "inline": True,
+                },
+                {
+                    "name": "**Started At**",
+                    "value": started_at_timestamp,
+                    "inline": True,
+                },
+            ],
+            "image": {"url": cache_busted_thumb_url},
+            "footer": {"text": f"Online for {age} | Last updated"},
+        }
     )
+    embed.timestamp = now
+    return embed
 
 
 def _create_live_view(url: str) -> View:
@@ -676,7 +698,8 @@ async def _handle_live_embed_edit_error(
     """Handle errors when editing live embed. Returns True if should continue, False if should abort."""
     if isinstance(e, discord.NotFound):
         logger.warning(
-            f"Message not found when editing live embed for message_id={message_id}; aborting"
+            "Message not found when editing live embed for message_id=%s; aborting",
+            message_id,
         )
         try:
             delete_row_from_parquet(broadcaster_id, LIVE_ALERTS)
@@ -688,7 +711,8 @@ async def _handle_live_embed_edit_error(
         return False
     elif isinstance(e, discord.HTTPException) and e.status == 503:
         logger.warning(
-            f"Discord API temporarily unavailable (503) for message_id={message_id}; will retry next cycle"
+            "Discord API temporarily unavailable (503) for message_id=%s; will retry next cycle",
+            message_id,
         )
         return True
     else:
@@ -707,7 +731,9 @@ async def _handle_live_embed_edit_error(
 
         if is_transient:
             logger.warning(
-                f"Transient network error when editing live embed for message_id={message_id}; will retry next cycle: {e}"
+                "Transient network error when editing live embed for message_id=%s; will retry next cycle: %s",
+                message_id,
+                e,
             )
             return True
 
@@ -751,7 +777,7 @@ async def _run_update_cycle(
     channel_id: int,
     message_id: int,
     stream_id: int,
-    started_at: pendulum.DateTime,
+    started_at: datetime,
     started_at_timestamp: str,
     content: Optional[str],
 ) -> None:
@@ -825,10 +851,8 @@ async def update_alert(
     try:
         await asyncio.sleep(60)
 
-        content = (
-            f"<@&{LIVE_ALERTS_ROLE}>" if channel_id == STREAM_ALERTS_CHANNEL else None
-        )
-        started_at = parse_rfc3339(stream_started_at)
+        content = LIVE_ALERTS_MENTION if channel_id == STREAM_ALERTS_CHANNEL else None
+        started_at = datetime.fromisoformat(stream_started_at)
         started_at_timestamp = f"<t:{int(started_at.timestamp())}:f>"
 
         # Initial validation
@@ -838,15 +862,16 @@ async def update_alert(
 
         # Main update loop
         while True:
-            await _run_update_cycle(
-                broadcaster_id,
-                channel_id,
-                message_id,
-                stream_id,
-                started_at,
-                started_at_timestamp,
-                content,
-            )
+            async with _alert_update_semaphore:
+                await _run_update_cycle(
+                    broadcaster_id,
+                    channel_id,
+                    message_id,
+                    stream_id,
+                    started_at,
+                    started_at_timestamp,
+                    content,
+                )
 
             await asyncio.sleep(60)
 
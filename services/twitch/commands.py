@@ -1,27 +1,44 @@
-from models import ChannelChatMessageEventSub
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+from models import Channel, ChannelChatMessageEventSub, User
 from services.helper.twitch import check_mod, twitch_send_message
 from services.twitch.api import get_channel, get_user_by_username
 
 from .shoutout_queue import shoutout_queue
 
+_DISCORD_MESSAGE = "https://discord.gg/tkJyNJH2k7 Come join us and hang out! This is also where all my updates on streams and whatnot go"
+_KOFI_MESSAGE = "Idk why you would want to donate, but here: https://ko-fi.com/valinmalach But always remember to take care of yourselves first!"
+_SOCIALS_MESSAGE = "Twitter: https://twitter.com/ValinMalach"
+_THRONE_MESSAGE = "There's really only one thing on it for now lol... https://throne.com/valinmalach If I do add more, they will all be for stream!"
+_RAID_MESSAGES = (
+    "valinmArrive valinmRaid Valin Raid valinmArrive valinmRaid Valin Raid valinmArrive valinmRaid Your Fallen Angel is here valinmCake valinmCake",
+    "DinoDance DinoDance Valin Raid DinoDance DinoDance Valin Raid DinoDance DinoDance Your Fallen Angel is here <3 <3",
+)
+
+# Shoutout lookups keyed by lowercase login: (expires_at, user, channel)
+_SHOUTOUT_CACHE_TTL = 300.0
+_SHOUTOUT_CACHE_MAXSIZE = 512
+_shoutout_cache: dict[str, tuple[float, User, Channel]] = {}
+
 
 async def lurk(event_sub: ChannelChatMessageEventSub, _: str) -> None:
-    broadcaster_id = event_sub.event.broadcaster_user_id
-    chatter_name = event_sub.event.chatter_user_name
+    event = event_sub.event
+    broadcaster_id = event.broadcaster_user_id
+    chatter_name = event.chatter_user_name
     message = f"{chatter_name} has gone to lurk. Eat, drink, sleep, water your pets, feed your plants. Make sure to take care of yourself and stay safe while you're away!"
     await twitch_send_message(broadcaster_id, message)
 
 
 async def discord_command(event_sub: ChannelChatMessageEventSub, _: str) -> None:
     broadcaster_id = event_sub.event.broadcaster_user_id
-    message = "https://discord.gg/tkJyNJH2k7 Come join us and hang out! This is also where all my updates on streams and whatnot go"
-    await twitch_send_message(broadcaster_id, message)
+    await twitch_send_message(broadcaster_id, _DISCORD_MESSAGE)
 
 
 async def kofi(event_sub: ChannelChatMessageEventSub, _: str) -> None:
     broadcaster_id = event_sub.event.broadcaster_user_id
-    message = "Idk why you would want to donate, but here: https://ko-fi.com/valinmalach But always remember to take care of yourselves first!"
-    await twitch_send_message(broadcaster_id, message)
+    await twitch_send_message(broadcaster_id, _KOFI_MESSAGE)
 
 
 # async def megathon(event_sub: ChannelChatMessageEventSub, _: str) -> None:
@@ -34,35 +51,33 @@ async def kofi(event_sub: ChannelChatMessageEventSub, _: str) -> None:
 
 async def raid(event_sub: ChannelChatMessageEventSub, _: str) -> None:
     broadcaster_id = event_sub.event.broadcaster_user_id
-    message = "valinmArrive valinmRaid Valin Raid valinmArrive valinmRaid Valin Raid valinmArrive valinmRaid Your Fallen Angel is here valinmCake valinmCake"
-    await twitch_send_message(broadcaster_id, message)
-    message = "DinoDance DinoDance Valin Raid DinoDance DinoDance Valin Raid DinoDance DinoDance Your Fallen Angel is here <3 <3"
-    await twitch_send_message(broadcaster_id, message)
+    for message in _RAID_MESSAGES:
+        await twitch_send_message(broadcaster_id, message)
 
 
 async def socials(event_sub: ChannelChatMessageEventSub, _: str) -> None:
     broadcaster_id = event_sub.event.broadcaster_user_id
-    message = "Twitter: https://twitter.com/ValinMalach"
-    await twitch_send_message(broadcaster_id, message)
+    await twitch_send_message(broadcaster_id, _SOCIALS_MESSAGE)
 
 
 async def throne(event_sub: ChannelChatMessageEventSub, _: str) -> None:
     broadcaster_id = event_sub.event.broadcaster_user_id
-    message = "There's really only one thing on it for now lol... https://throne.com/valinmalach If I do add more, they will all be for stream!"
-    await twitch_send_message(broadcaster_id, message)
+    await twitch_send_message(broadcaster_id, _THRONE_MESSAGE)
 
 
 async def unlurk(event_sub: ChannelChatMessageEventSub, _: str) -> None:
-    broadcaster_id = event_sub.event.broadcaster_user_id
-    chatter_name = event_sub.event.chatter_user_name
+    event = event_sub.event
+    broadcaster_id = event.broadcaster_user_id
+    chatter_name = event.chatter_user_name
     message = f"{chatter_name} has returned from their lurk. Welcome back! Hope you had a good break and are ready to hang out again!"
     await twitch_send_message(broadcaster_id, message)
 
 
 async def hug(event_sub: ChannelChatMessageEventSub, args: str) -> None:
     target = args.split(" ", 1)[0] if args else ""
-    broadcaster_id = event_sub.event.broadcaster_user_id
-    chatter_name = event_sub.event.chatter_user_name
+    event = event_sub.event
+    broadcaster_id = event.broadcaster_user_id
+    chatter_name = event.chatter_user_name
     if not target:
         message = f"{chatter_name} gives everyone a big warm hug. How sweet! <3"
         await twitch_send_message(broadcaster_id, message)
@@ -71,23 +86,42 @@ async def hug(event_sub: ChannelChatMessageEventSub, args: str) -> None:
     await twitch_send_message(broadcaster_id, message)
 
 
+async def _get_shoutout_target(target: str) -> tuple[User, Channel] | None:
+    """Resolve a login to its user and channel, reusing recent lookups."""
+    key = target.lower()
+    now = time.monotonic()
+    cached = _shoutout_cache.get(key)
+    if cached is not None and cached[0] > now:
+        return cached[1], cached[2]
+
+    user = await get_user_by_username(target)
+    target_channel = await get_channel(int(user.id)) if user else None
+    if user is None or target_channel is None:
+        _shoutout_cache.pop(key, None)
+        return None
+
+    if len(_shoutout_cache) >= _SHOUTOUT_CACHE_MAXSIZE:
+        _shoutout_cache.pop(next(iter(_shoutout_cache)))
+    _shoutout_cache[key] = (now + _SHOUTOUT_CACHE_TTL, user, target_channel)
+    return user, target_channel
+
+
 async def shoutout(event_sub: ChannelChatMessageEventSub, args: str) -> None:
     if not await check_mod(event_sub):
         return None
 
-    broadcaster_id = event_sub.event.broadcaster_user_id
-    target = (
-        args.split(" ", 1)[0] if args else ""
-    ) or event_sub.event.broadcaster_user_login
+    event = event_sub.event
+    broadcaster_id = event.broadcaster_user_id
+    target = (args.split(" ", 1)[0] if args else "") or event.broadcaster_user_login
     if target.startswith("@"):
         target = target[1:]
 
-    user = await get_user_by_username(target)
-    target_channel = await get_channel(int(user.id)) if user else None
-    if not target_channel:
+    shoutout_target = await _get_shoutout_target(target)
+    if shoutout_target is None:
         message = "User not found."
         await twitch_send_message(broadcaster_id, message)
         return None
+    user, target_channel = shoutout_target
 
     if shoutout_queue.activated:
         shoutout_queue.add_to_queue(user.login, str(user.id))
@@ -96,13 +130,23 @@ async def shoutout(event_sub: ChannelChatMessageEventSub, args: str) -> None:
     await twitch_send_message(broadcaster_id, message)
 
 
+_EVERYTHING_COMMANDS: tuple[
+    Callable[[ChannelChatMessageEventSub, str], Awaitable[None]], ...
+] = (
+    discord_command,
+    socials,
+    kofi,
+    throne,
+    # megathon,
+    raid,
+)
+
+
 async def everything(event_sub: ChannelChatMessageEventSub, args: str) -> None:
     if not await check_mod(event_sub):
         return None
 
-    await discord_command(event_sub, args)
-    await socials(event_sub, args)
-    await kofi(event_sub, args)
-    await throne(event_sub, args)
-    # await megathon(event_sub, args)
-    await raid(event_sub, args)
+    # Each command's own messages stay in order; the commands are independent
+    await asyncio.gather(
+        *(command(event_sub, args) for command in _EVERYTHING_COMMANDS)
+    )
@@ -8,15 +8,12 @@ from typing import Optional
 import discord
 import httpx
 import pendulum
-from dotenv import load_dotenv
 
 from constants import BOT_ADMIN_CHANNEL, ErrorDetails, TokenType
 from services.helper.helper import send_message
 from services.helper.twitch import call_twitch
 from services.twitch.api import get_user
 
-load_dotenv()
-
 logger = logging.getLogger(__name__)
 
 TWITCH_BOT_USER_ID = os.getenv("TWITCH_BOT_USER_ID")
@@ -105,7 +102,9 @@ class TwitchShoutoutQueue:
 
                 user = await get_user(int(user_id_str))
                 if not user:
-                    logger.warning("User id %s (%s) not found for shoutout", user_id_str, login)
+                    logger.warning(
+                        "User id %s (%s) not found for shoutout", user_id_str, login
+                    )
                     await send_message(
                         f"User {login} not found for shoutout", BOT_ADMIN_CHANNEL
                     )
@@ -3,7 +3,7 @@ import os
 from typing import Optional
 
 import aiofiles
-from dotenv import load_dotenv
+import aiofiles.os
 
 from constants import (
     APP_ACCESS_TOKEN_FILE,
@@ -17,14 +17,22 @@ from models import AuthResponse, RefreshResponse
 from services.helper.helper import send_message
 from services.helper.http_client import http_client_manager
 
-load_dotenv()
-
 logger = logging.getLogger(__name__)
 
 TWITCH_CLIENT_ID = os.getenv("TWITCH_CLIENT_ID")
 TWITCH_CLIENT_SECRET = os.getenv("TWITCH_CLIENT_SECRET")
 
 
+async def _save_token(filepath: str, token: str, previous: str) -> None:
+    """Persist a token via a temp file and atomic replace, skipping unchanged ones."""
+    if token == previous:
+        return None
+    tmp_filepath = f"{filepath}.tmp"
+    async with aiofiles.open(tmp_filepath, "w") as f:
+        await f.write(token)
+    await aiofiles.os.replace(tmp_filepath, filepath)
+
+
 class TwitchTokenManager:
     _instance: Optional["TwitchTokenManager"] = None
     _app_access_token: str = ""
@@ -52,7 +60,7 @@ class TwitchTokenManager:
         except FileNotFoundError:
             logger.info("No existing app access token file found")
         except Exception as e:
-            logger.error(f"Error loading app access token from file: {e}")
+            logger.error("Error loading app access token from file: %s", e)
 
     def _load_user_refresh_token(self) -> None:
         """Load user refresh token from file if it exists."""
@@ -63,7 +71,7 @@ class TwitchTokenManager:
         except FileNotFoundError:
             logger.info("No existing user refresh token file found")
         except Exception as e:
-            logger.error(f"Error loading user refresh token from file: {e}")
+            logger.error("Error loading user refresh token from file: %s", e)
 
     def _load_user_access_token(self) -> None:
         """Load user access token from file if it exists."""
@@ -74,7 +82,7 @@ class TwitchTokenManager:
         except FileNotFoundError:
             logger.info("No existing user access token file found")
         except Exception as e:
-            logger.error(f"Error loading user access token from file: {e}")
+            logger.error("Error loading user access token from file: %s", e)
 
     def _load_broadcaster_refresh_token(self) -> None:
         """Load broadcaster refresh token from file if it exists."""
@@ -85,7 +93,7 @@ class TwitchTokenManager:
         except FileNotFoundError:
             logger.info("No existing broadcaster refresh token file found")
         except Exception as e:
-            logger.error(f"Error loading broadcaster refresh token from file: {e}")
+            logger.error("Error loading broadcaster refresh token from file: %s", e)
 
     def _load_broadcaster_access_token(self) -> None:
         """Load broadcaster access token from file if it exists."""
@@ -96,7 +104,7 @@ class TwitchTokenManager:
         except FileNotFoundError:
             logger.info("No existing broadcaster access token file found")
         except Exception as e:
-            logger.error(f"Error loading broadcaster access token from file: {e}")
+            logger.error("Error loading broadcaster access token from file: %s", e)
 
     @property
     def app_access_token(self) -> str:
@@ -142,44 +150,56 @@ class TwitchTokenManager:
         )
 
         if response.status_code < 200 or response.status_code >= 300:
-            logger.error(f"Token refresh failed with status={response.status_code}")
+            logger.error("Token refresh failed with status=%s", response.status_code)
             await send_message(
                 f"Failed to refresh access token: {response.status_code} {response.text}",
                 BOT_ADMIN_CHANNEL,
             )
             return False
 
-        auth_response = AuthResponse.model_validate(response.json())
+        auth_response = AuthResponse.model_validate_json(response.content)
 
         if auth_response.token_type == "bearer":
+            previous = self._app_access_token
             self._app_access_token = auth_response.access_token
-            async with aiofiles.open(APP_ACCESS_TOKEN_FILE, "w") as f:
-                await f.write(self._app_access_token)
+            await _save_token(APP_ACCESS_TOKEN_FILE, self._app_access_token, previous)
             return True
         else:
-            logger.error(f"Unexpected token type received: {auth_response.token_type}")
+            logger.error("Unexpected token type received: %s", auth_response.token_type)
             await send_message(
                 f"Unexpected token type: {auth_response.token_type}", BOT_ADMIN_CHANNEL
             )
             return False
 
     async def set_user_access_token(self, auth_response: RefreshResponse) -> None:
+        previous_access_token = self._user_access_token
+        previous_refresh_token = self._user_refresh_token
         self._user_access_token = auth_response.access_token
         self._user_refresh_token = auth_response.refresh_token
-        async with aiofiles.open(USER_ACCESS_TOKEN_FILE, "w") as f:
-            await f.write(self._user_access_token)
-        async with aiofiles.open(USER_REFRESH_TOKEN_FILE, "w") as f:
-            await f.write(self._user_refresh_token)
+        await _save_token(
+            USER_ACCESS_TOKEN_FILE, self._user_access_token, previous_access_token
+        )
+        await _save_token(
+            USER_REFRESH_TOKEN_FILE, self._user_refresh_token, previous_refresh_token
+        )
 
     async def set_broadcaster_access_token(
         self, auth_response: RefreshResponse
     ) -> None:
+        previous_access_token = self._broadcaster_access_token
+        previous_refresh_token = self._broadcaster_refresh_token
         self._broadcaster_access_token = auth_response.access_token
         self._broadcaster_refresh_token = auth_response.refresh_token
-        async with aiofiles.open(BROADCASTER_ACCESS_TOKEN_FILE, "w") as f:
-            await f.write(self._broadcaster_access_token)
-        async with aiofiles.open(BROADCASTER_REFRESH_TOKEN_FILE, "w") as f:
-            await f.write(self._broadcaster_refresh_token)
+        await _save_token(
+            BROADCASTER_ACCESS_TOKEN_FILE,
+            self._broadcaster_access_token,
+            previous_access_token,
+        )
+        await _save_token(
+            BROADCASTER_REFRESH_TOKEN_FILE,
+            self._broadcaster_refresh_token,
+            previous_refresh_token,
+        )
 
     async def refresh_user_access_token(self, broadcaster: bool = False) -> bool:
         if not broadcaster and not self._user_refresh_token:
@@ -207,7 +227,9 @@ class TwitchTokenManager:
 
         if response.status_code < 200 or response.status_code >= 300:
             logger.error(
-                f"{'Broadcaster' if broadcaster else 'User'} token refresh failed with status={response.status_code}"
+                "%s token refresh failed with status=%s",
+                "Broadcaster" if broadcaster else "User",
+                response.status_code,
             )
             await send_message(
                 f"Failed to refresh {'broadcaster' if broadcaster else 'user'} access token: {response.status_code} {response.text}",
@@ -215,7 +237,7 @@ class TwitchTokenManager:
             )
             return False
 
-        auth_response = RefreshResponse.model_validate(response.json())
+        auth_response = RefreshResponse.model_validate_json(response.content)
 
         if auth_response.token_type == "bearer":
             await self.set_broadcaster_access_token(
@@ -223,7 +245,7 @@ class TwitchTokenManager:
             ) if broadcaster else await self.set_user_access_token(auth_response)
             return True
         else:
-            logger.error(f"Unexpected token type received: {auth_response.token_type}")
+            logger.error("Unexpected token type received: %s", auth_response.token_type)
             await send_message(
                 f"Unexpected token type: {auth_response.token_type}", BOT_ADMIN_CHANNEL
             )